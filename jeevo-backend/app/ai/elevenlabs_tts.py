@@ -68,11 +68,11 @@ class ElevenLabsTTS:
             # Convert generator to bytes
             audio_bytes = b"".join(audio)
             
-            logger.info(f"Generated TTS audio: {len(audio_bytes)} bytes")
+            logger.info("Generated TTS audio: %s bytes", len(audio_bytes))
             return audio_bytes
             
         except Exception as e:
-            logger.error(f"TTS error: {e}")
+            logger.error("TTS error: %s", e)
             raise Exception(f"TTS error: {str(e)}")
     
     def save_audio(self, audio_bytes: bytes, filepath: str):
@@ -80,7 +80,7 @@ class ElevenLabsTTS:
         try:
             with open(filepath, "wb") as f:
                 f.write(audio_bytes)
-            logger.info(f"Saved audio to {filepath}")
+            logger.info("Saved audio to %s", filepath)
         except Exception as e:
-            logger.error(f"Error saving audio: {e}")
+            logger.error("Error saving audio: %s", e)
             raise
@@ -7,6 +7,40 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Display names used to tell the model which language to respond in
+LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi (हिंदी)",
+    "bn": "Bengali (বাংলা)",
+    "te": "Telugu (తెలుగు)",
+    "mr": "Marathi (मराठी)",
+    "ta": "Tamil (தமிழ்)",
+    "gu": "Gujarati (ગુજરાતી)",
+    "kn": "Kannada (ಕನ್ನಡ)",
+    "ml": "Malayalam (മലയാളം)",
+    "pa": "Punjabi (ਪੰਜਾਬੀ)",
+}
+
+SYSTEM_PROMPT_TEMPLATE = """You are Jeevo, a helpful healthcare assistant for rural and semi-urban communities in India.
+        
+        Guidelines:
+        - Provide clear, simple medical guidance
+        - Always add disclaimer: "⚠️ This is general guidance. Please consult a qualified doctor for proper diagnosis and treatment."
+        - Be empathetic and supportive
+        - Respond in {language_name} language
+        - For emergencies (severe symptoms, injuries), immediately advise seeking emergency medical care
+        - Keep responses concise and actionable (max 400 words)
+        - Use simple language that's easy to understand
+        - Suggest basic home remedies when appropriate
+        - Recommend when to see a doctor
+        """
+
+# System prompts rendered once per supported language
+_SYSTEM_PROMPTS = {
+    code: SYSTEM_PROMPT_TEMPLATE.format(language_name=name)
+    for code, name in LANGUAGE_NAMES.items()
+}
+
 
 class MedicalLLM:
     """Medical Language Model for healthcare responses"""
@@ -22,44 +56,17 @@ class MedicalLLM:
                 base_url="https://api.groq.com/openai/v1"
             )
             self.model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-            logger.info(f"Initialized Medical LLM with Groq: {self.model}")
+            logger.info("Initialized Medical LLM with Groq: %s", self.model)
         else:
             api_key = api_key or os.getenv("OPENAI_API_KEY")
             self.client = openai.OpenAI(api_key=api_key)
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            logger.info(f"Initialized Medical LLM with OpenAI: {self.model}")
+            logger.info("Initialized Medical LLM with OpenAI: %s", self.model)
         
     def get_medical_response(self, user_message: str, language: str = "en") -> str:
         """Generate medical guidance response in specified language"""
         
-        language_names = {
-            "en": "English",
-            "hi": "Hindi (हिंदी)",
-            "bn": "Bengali (বাংলা)",
-            "te": "Telugu (తెలుగు)",
-            "mr": "Marathi (मराठी)",
-            "ta": "Tamil (தமிழ்)",
-            "gu": "Gujarati (ગુજરાતી)",
-            "kn": "Kannada (ಕನ್ನಡ)",
-            "ml": "Malayalam (മലയാളം)",
-            "pa": "Punjabi (ਪੰਜਾਬੀ)",
-        }
-        
-        lang_name = language_names.get(language, "English")
-        
-        system_prompt = f"""You are Jeevo, a helpful healthcare assistant for rural and semi-urban communities in India.
-        
-        Guidelines:
-        - Provide clear, simple medical guidance
-        - Always add disclaimer: "⚠️ This is general guidance. Please consult a qualified doctor for proper diagnosis and treatment."
-        - Be empathetic and supportive
-        - Respond in {lang_name} language
-        - For emergencies (severe symptoms, injuries), immediately advise seeking emergency medical care
-        - Keep responses concise and actionable (max 400 words)
-        - Use simple language that's easy to understand
-        - Suggest basic home remedies when appropriate
-        - Recommend when to see a doctor
-        """
+        system_prompt = _SYSTEM_PROMPTS.get(language, _SYSTEM_PROMPTS["en"])
         
         try:
             response = self.client.chat.completions.create(
@@ -75,7 +82,7 @@ class MedicalLLM:
             return response.choices[0].message.content
             
         except Exception as e:
-            logger.error(f"Error generating LLM response: {e}")
+            logger.error("Error generating LLM response: %s", e)
             return f"⚠️ Sorry, I encountered an error processing your request. Please try again."
 
     def get_medical_reply(self, user_message: str, language: str = "en") -> str:
@@ -8,6 +8,49 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Display names used to tell the model which language to respond in
+LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi (हिंदी)",
+    "ta": "Tamil (தமிழ்)",
+    "te": "Telugu (తెలుగు)",
+    "bn": "Bengali (বাংলা)"
+}
+
+# Shorter names for the URL-based prompt, without native script
+PLAIN_LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi",
+    "ta": "Tamil",
+    "te": "Telugu"
+}
+
+IMAGE_SYSTEM_PROMPT_TEMPLATE = """You are a medical image analyzer for Jeevo healthcare assistant.
+        
+        Guidelines:
+        - Describe what you see in the image clearly
+        - Provide preliminary assessment (NOT a diagnosis)
+        - Suggest whether medical attention is needed and urgency level
+        - Respond in {language_name} language
+        - Keep response concise and actionable
+        - Always add: "⚠️ This is not a medical diagnosis. Please consult a doctor for proper evaluation."
+        """
+
+URL_SYSTEM_PROMPT_TEMPLATE = """You are a medical image analyzer for Jeevo.
+        Provide assessment in {language_name}. 
+        Always add medical disclaimer: "This is not a diagnosis. Consult a doctor."
+        """
+
+# System prompts rendered once per supported language
+_IMAGE_SYSTEM_PROMPTS = {
+    code: IMAGE_SYSTEM_PROMPT_TEMPLATE.format(language_name=name)
+    for code, name in LANGUAGE_NAMES.items()
+}
+_URL_SYSTEM_PROMPTS = {
+    code: URL_SYSTEM_PROMPT_TEMPLATE.format(language_name=name)
+    for code, name in PLAIN_LANGUAGE_NAMES.items()
+}
+
 
 class VisionAnalyzer:
     """Medical image analysis service"""
@@ -23,12 +66,12 @@ class VisionAnalyzer:
                 base_url="https://api.groq.com/openai/v1"
             )
             self.model = os.getenv("GROQ_VISION_MODEL", "llama-3.2-90b-vision-preview")
-            logger.info(f"Initialized Vision analyzer with Groq: {self.model}")
+            logger.info("Initialized Vision analyzer with Groq: %s", self.model)
         else:
             api_key = api_key or os.getenv("OPENAI_API_KEY")
             self.client = openai.OpenAI(api_key=api_key)
             self.model = os.getenv("OPENAI_VISION_MODEL", "gpt-4o-mini")
-            logger.info(f"Initialized Vision analyzer with OpenAI: {self.model}")
+            logger.info("Initialized Vision analyzer with OpenAI: %s", self.model)
     
     def analyze_image(self, image_path: str, query: str = "Analyze this medical image", 
                      language: str = "en") -> str:
@@ -44,34 +87,16 @@ class VisionAnalyzer:
             Analysis text
         """
         
-        language_names = {
-            "en": "English",
-            "hi": "Hindi (हिंदी)",
-            "ta": "Tamil (தமிழ்)",
-            "te": "Telugu (తెలుగు)",
-            "bn": "Bengali (বাংলা)"
-        }
-        lang_name = language_names.get(language, "English")
+        system_prompt = _IMAGE_SYSTEM_PROMPTS.get(language, _IMAGE_SYSTEM_PROMPTS["en"])
         
         # Read and encode image
         try:
             with open(image_path, "rb") as image_file:
                 base64_image = base64.b64encode(image_file.read()).decode('utf-8')
         except Exception as e:
-            logger.error(f"Error reading image {image_path}: {e}")
+            logger.error("Error reading image %s: %s", image_path, e)
             return f"Error reading image: {str(e)}"
         
-        system_prompt = f"""You are a medical image analyzer for Jeevo healthcare assistant.
-        
-        Guidelines:
-        - Describe what you see in the image clearly
-        - Provide preliminary assessment (NOT a diagnosis)
-        - Suggest whether medical attention is needed and urgency level
-        - Respond in {lang_name} language
-        - Keep response concise and actionable
-        - Always add: "⚠️ This is not a medical diagnosis. Please consult a doctor for proper evaluation."
-        """
-        
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -100,7 +125,7 @@ class VisionAnalyzer:
             return response.choices[0].message.content
             
         except Exception as e:
-            logger.error(f"Error analyzing image: {e}")
+            logger.error("Error analyzing image: %s", e)
             return f"⚠️ Error analyzing image: {str(e)}"
     
     def analyze_from_url(self, image_url: str, query: str, language: str = "en") -> str:
@@ -116,18 +141,7 @@ class VisionAnalyzer:
             Analysis text
         """
         
-        language_names = {
-            "en": "English",
-            "hi": "Hindi",
-            "ta": "Tamil",
-            "te": "Telugu"
-        }
-        lang_name = language_names.get(language, "English")
-        
-        system_prompt = f"""You are a medical image analyzer for Jeevo.
-        Provide assessment in {lang_name}. 
-        Always add medical disclaimer: "This is not a diagnosis. Consult a doctor."
-        """
+        system_prompt = _URL_SYSTEM_PROMPTS.get(language, _URL_SYSTEM_PROMPTS["en"])
         
         try:
             response = self.client.chat.completions.create(
@@ -149,5 +163,5 @@ class VisionAnalyzer:
             return response.choices[0].message.content
             
         except Exception as e:
-            logger.error(f"Error analyzing image from URL: {e}")
+            logger.error("Error analyzing image from URL: %s", e)
             return f"⚠️ Error: {str(e)}"
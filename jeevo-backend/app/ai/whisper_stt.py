@@ -48,11 +48,11 @@ class WhisperSTT:
                 response_format="text"
             )
             
-            logger.info(f"Successfully transcribed audio in {language}")
+            logger.info("Successfully transcribed audio in %s", language)
             return transcript
             
         except Exception as e:
-            logger.error(f"Error transcribing audio: {e}")
+            logger.error("Error transcribing audio: %s", e)
             return f"Error transcribing audio: {str(e)}"
     
     def detect_language_and_transcribe(self, audio_file: BinaryIO) -> Dict:
@@ -74,9 +74,9 @@ class WhisperSTT:
                 "language": transcript.language
             }
             
-            logger.info(f"Transcribed audio: detected language={result['language']}")
+            logger.info("Transcribed audio: detected language=%s", result['language'])
             return result
             
         except Exception as e:
-            logger.error(f"Error in language detection/transcription: {e}")
+            logger.error("Error in language detection/transcription: %s", e)
             return {"error": str(e)}
@@ -30,10 +30,14 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
     REDIS_TTL: int = 3600  # Default TTL in seconds
+    REDIS_MAX_CONNECTIONS: int = 50
     
     # Session Configuration
     SESSION_EXPIRE_MINUTES: int = 60
     
+    # Directory for downloaded media and generated audio
+    TEMP_DIR: str = "temp"
+    
     # AI/ML Configuration
     USE_GROQ: bool = True
     GROQ_API_KEY: Optional[str] = None
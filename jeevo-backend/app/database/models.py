@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, JSON, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -71,6 +71,10 @@ class User(Base):
 class Conversation(Base):
     """Store conversation history"""
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Serves recent-history lookups (filter by user, newest first)
+        Index("ix_conversations_user_id_created_at", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -99,6 +103,10 @@ class Conversation(Base):
 class Reminder(Base):
     """Medical reminders table"""
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Serves the due-reminder scan (unsent, ordered by scheduled time)
+        Index("ix_reminders_is_sent_scheduled_time", "is_sent", "scheduled_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -160,6 +168,10 @@ class LocalRiskLevel(Base):
 class HealthAlert(Base):
     """Store health alerts and announcements"""
     __tablename__ = "health_alerts"
+    __table_args__ = (
+        # Serves active-alert lookups (active only, highest priority first)
+        Index("ix_health_alerts_is_active_priority", "is_active", "priority"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
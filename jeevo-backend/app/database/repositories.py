@@ -1,4 +1,4 @@
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 from datetime import datetime
@@ -18,8 +18,7 @@ class UserRepository:
         user = User(phone_number=phone_number, **kwargs)
         db.add(user)
         await db.commit()
-        await db.refresh(user)
-        logger.info(f"Created user: {phone_number}")
+        logger.info("Created user: %s", phone_number)
         return user
     
     @staticmethod
@@ -51,8 +50,7 @@ class UserRepository:
             for key, value in kwargs.items():
                 setattr(user, key, value)
             await db.commit()
-            await db.refresh(user)
-            logger.info(f"Updated user: {phone_number}")
+            logger.info("Updated user: %s", phone_number)
         return user
     
     @staticmethod
@@ -82,7 +80,6 @@ class ConversationRepository:
         )
         db.add(conversation)
         await db.commit()
-        await db.refresh(conversation)
         return conversation
     
     @staticmethod
@@ -114,8 +111,7 @@ class ReminderRepository:
         reminder = Reminder(user_id=user_id, **kwargs)
         db.add(reminder)
         await db.commit()
-        await db.refresh(reminder)
-        logger.info(f"Created reminder for user {user_id}: {reminder.title}")
+        logger.info("Created reminder for user %s: %s", user_id, reminder.title)
         return reminder
     
     @staticmethod
@@ -129,8 +125,8 @@ class ReminderRepository:
         
         if active_only:
             query = query.where(
-                Reminder.is_sent == False,
-                Reminder.is_completed == False
+                Reminder.is_sent.is_(False),
+                Reminder.is_completed.is_(False)
             )
         
         result = await db.execute(query.order_by(Reminder.scheduled_time))
@@ -143,7 +139,7 @@ class ReminderRepository:
         result = await db.execute(
             select(Reminder)
             .where(
-                Reminder.is_sent == False,
+                Reminder.is_sent.is_(False),
                 Reminder.scheduled_time <= now
             )
             .order_by(Reminder.scheduled_time)
@@ -162,7 +158,6 @@ class ReminderRepository:
             reminder.is_sent = True
             reminder.sent_at = datetime.utcnow()
             await db.commit()
-            await db.refresh(reminder)
         
         return reminder
 
@@ -178,6 +173,16 @@ class RiskLevelRepository:
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def _apply_changes(risk_level: LocalRiskLevel, fields: dict) -> bool:
+        """Set fields that differ from the stored values; return whether any changed"""
+        changed = False
+        for key, value in fields.items():
+            if getattr(risk_level, key) != value:
+                setattr(risk_level, key, value)
+                changed = True
+        return changed
+    
     @staticmethod
     async def update_risk_level(
         db: AsyncSession,
@@ -188,15 +193,15 @@ class RiskLevelRepository:
         risk_level = await RiskLevelRepository.get_risk_level(db, pincode)
         
         if risk_level:
-            for key, value in kwargs.items():
-                setattr(risk_level, key, value)
+            # Nothing to write if the stored risk is unchanged
+            if not RiskLevelRepository._apply_changes(risk_level, kwargs):
+                return risk_level
             risk_level.last_updated = datetime.utcnow()
         else:
             risk_level = LocalRiskLevel(pincode=pincode, **kwargs)
             db.add(risk_level)
         
         await db.commit()
-        await db.refresh(risk_level)
         return risk_level
 
 
@@ -209,8 +214,7 @@ class HealthAlertRepository:
         alert = HealthAlert(**kwargs)
         db.add(alert)
         await db.commit()
-        await db.refresh(alert)
-        logger.info(f"Created health alert: {alert.title}")
+        logger.info("Created health alert: %s", alert.title)
         return alert
     
     @staticmethod
@@ -222,8 +226,8 @@ class HealthAlertRepository:
         now = datetime.utcnow()
         
         query = select(HealthAlert).where(
-            HealthAlert.is_active == True,
-            (HealthAlert.expires_at == None) | (HealthAlert.expires_at > now)
+            HealthAlert.is_active.is_(True),
+            or_(HealthAlert.expires_at.is_(None), HealthAlert.expires_at > now)
         )
         
         result = await db.execute(query.order_by(HealthAlert.priority.desc()))
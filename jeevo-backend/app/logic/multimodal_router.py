@@ -4,30 +4,57 @@ from app.ai.llm import MedicalLLM
 from app.ai.whisper_stt import WhisperSTT
 from app.ai.elevenlabs_tts import ElevenLabsTTS
 from app.ai.vision import VisionAnalyzer
-from typing import Dict, Optional
+from app.config.settings import settings
+from typing import NotRequired, Optional, TypedDict
 import os
+import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class FixedReply(TypedDict):
+    """Language-independent part of a router reply"""
+    type: str  # text, voice or error
+    content: str
+
+
+class RouterResponse(FixedReply):
+    """Reply produced by the router for the webhook to send"""
+    language: str
+    audio_path: NotRequired[Optional[str]]
+    transcription: NotRequired[str]
+    original_image: NotRequired[str]
+
+
+# Fixed replies for unavailable services and failures; copied per call with the language added
+TEXT_UNAVAILABLE_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ AI service temporarily unavailable. Please try again later."}
+TEXT_ERROR_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ Sorry, I encountered an error. Please try again."}
+VOICE_UNAVAILABLE_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ Voice processing temporarily unavailable."}
+VOICE_ERROR_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ Could not process voice message. Please try again."}
+IMAGE_UNAVAILABLE_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ Image analysis temporarily unavailable."}
+IMAGE_ERROR_RESPONSE: FixedReply = {"type": "text", "content": "⚠️ Could not analyze image. Please try again."}
+
+
 class MultimodalRouter:
     """Route and process different types of messages (text, voice, image)"""
     
     def __init__(self):
         """Initialize all AI services"""
+        os.makedirs(settings.TEMP_DIR, exist_ok=True)
+        
         try:
             self.llm = MedicalLLM()
             logger.info("✅ Medical LLM initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize LLM: {e}")
+            logger.error("Failed to initialize LLM: %s", e)
             self.llm = None
         
         try:
             self.stt = WhisperSTT()
             logger.info("✅ Whisper STT initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize STT: {e}")
+            logger.error("Failed to initialize STT: %s", e)
             self.stt = None
         
         try:
@@ -38,17 +65,25 @@ class MultimodalRouter:
                 logger.warning("⚠️ TTS not initialized (API key missing)")
                 self.tts = None
         except Exception as e:
-            logger.error(f"Failed to initialize TTS: {e}")
+            logger.error("Failed to initialize TTS: %s", e)
             self.tts = None
         
         try:
             self.vision = VisionAnalyzer()
             logger.info("✅ Vision analyzer initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize Vision: {e}")
+            logger.error("Failed to initialize Vision: %s", e)
             self.vision = None
+        
+        # Message type -> handler taking (content, caption, language)
+        self._handlers = {
+            "text": lambda content, caption, language: self.process_text_message(content, language),
+            "audio": lambda content, caption, language: self.process_voice_message(content, language),
+            "voice": lambda content, caption, language: self.process_voice_message(content, language),
+            "image": self.process_image_message,
+        }
     
-    def process_text_message(self, text: str, language: str = "en") -> Dict:
+    def process_text_message(self, text: str, language: str = "en") -> RouterResponse:
         """
         Handle text input → text output
         
@@ -57,14 +92,10 @@ class MultimodalRouter:
             language: Language code
             
         Returns:
-            Dict with response details
+            RouterResponse with response details
         """
         if not self.llm:
-            return {
-                "type": "text",
-                "content": "⚠️ AI service temporarily unavailable. Please try again later.",
-                "language": language
-            }
+            return {**TEXT_UNAVAILABLE_RESPONSE, "language": language}
         
         try:
             response_text = self.llm.get_medical_response(text, language)
@@ -75,14 +106,10 @@ class MultimodalRouter:
                 "language": language
             }
         except Exception as e:
-            logger.error(f"Error processing text message: {e}")
-            return {
-                "type": "text",
-                "content": "⚠️ Sorry, I encountered an error. Please try again.",
-                "language": language
-            }
+            logger.error("Error processing text message: %s", e)
+            return {**TEXT_ERROR_RESPONSE, "language": language}
     
-    def process_voice_message(self, audio_file_path: str, language: str = "hi") -> Dict:
+    def process_voice_message(self, audio_file_path: str, language: str = "hi") -> RouterResponse:
         """
         Handle voice input → text OR voice output
         
@@ -91,14 +118,10 @@ class MultimodalRouter:
             language: Expected language
             
         Returns:
-            Dict with response details
+            RouterResponse with response details
         """
         if not self.stt or not self.llm:
-            return {
-                "type": "text",
-                "content": "⚠️ Voice processing temporarily unavailable.",
-                "language": language
-            }
+            return {**VOICE_UNAVAILABLE_RESPONSE, "language": language}
         
         try:
             # Step 1: Convert voice to text
@@ -106,12 +129,12 @@ class MultimodalRouter:
                 transcription = self.stt.detect_language_and_transcribe(audio_file)
             
             if "error" in transcription:
-                return {"type": "error", "content": transcription["error"]}
+                return {"type": "error", "content": transcription["error"], "language": language}
             
             detected_language = transcription.get("language", language)
             user_text = transcription["text"]
             
-            logger.info(f"Transcribed: '{user_text[:50]}...' in {detected_language}")
+            logger.info("Transcribed: '%s...' in %s", user_text[:50], detected_language)
             
             # Step 2: Get LLM response
             response_text = self.llm.get_medical_response(user_text, detected_language)
@@ -127,14 +150,18 @@ class MultimodalRouter:
                     )
                     
                     # Save audio file
-                    output_path = f"temp/response_{os.urandom(8).hex()}.mp3"
-                    os.makedirs("temp", exist_ok=True)
-                    self.tts.save_audio(audio_bytes, output_path)
-                    audio_path = output_path
+                    with tempfile.NamedTemporaryFile(
+                        dir=settings.TEMP_DIR,
+                        prefix="response_",
+                        suffix=".mp3",
+                        delete=False
+                    ) as f:
+                        f.write(audio_bytes)
+                        audio_path = f.name
                     
-                    logger.info(f"Generated voice response at {audio_path}")
+                    logger.info("Generated voice response at %s", audio_path)
                 except Exception as e:
-                    logger.warning(f"TTS failed, sending text response: {e}")
+                    logger.warning("TTS failed, sending text response: %s", e)
             
             return {
                 "type": "voice" if audio_path else "text",
@@ -145,15 +172,11 @@ class MultimodalRouter:
             }
             
         except Exception as e:
-            logger.error(f"Error processing voice message: {e}")
-            return {
-                "type": "text",
-                "content": "⚠️ Could not process voice message. Please try again.",
-                "language": language
-            }
+            logger.error("Error processing voice message: %s", e)
+            return {**VOICE_ERROR_RESPONSE, "language": language}
     
     def process_image_message(self, image_path: str, caption: str = "", 
-                             language: str = "en") -> Dict:
+                             language: str = "en") -> RouterResponse:
         """
         Handle image input → visual explanation (text)
         
@@ -163,14 +186,10 @@ class MultimodalRouter:
             language: Language code
             
         Returns:
-            Dict with response details
+            RouterResponse with response details
         """
         if not self.vision:
-            return {
-                "type": "text",
-                "content": "⚠️ Image analysis temporarily unavailable.",
-                "language": language
-            }
+            return {**IMAGE_UNAVAILABLE_RESPONSE, "language": language}
         
         try:
             query = caption if caption else "What do you see in this medical image? Provide guidance and assessment."
@@ -186,15 +205,11 @@ class MultimodalRouter:
             }
             
         except Exception as e:
-            logger.error(f"Error processing image: {e}")
-            return {
-                "type": "text",
-                "content": "⚠️ Could not analyze image. Please try again.",
-                "language": language
-            }
+            logger.error("Error processing image: %s", e)
+            return {**IMAGE_ERROR_RESPONSE, "language": language}
     
     def route_message(self, message_type: str, content: str, caption: str = "", 
-                     language: str = "en") -> Dict:
+                     language: str = "en") -> RouterResponse:
         """
         Main routing function
         
@@ -205,22 +220,16 @@ class MultimodalRouter:
             language: Language code
             
         Returns:
-            Dict with response details
+            RouterResponse with response details
         """
-        logger.info(f"Routing {message_type} message in {language}")
+        logger.info("Routing %s message in %s", message_type, language)
         
-        if message_type == "text":
-            return self.process_text_message(content, language)
-        
-        elif message_type == "audio" or message_type == "voice":
-            return self.process_voice_message(content, language)
-        
-        elif message_type == "image":
-            return self.process_image_message(content, caption, language)
-        
-        else:
+        handler = self._handlers.get(message_type)
+        if handler is None:
             return {
                 "type": "text",
                 "content": f"⚠️ Sorry, {message_type} messages are not yet supported.",
                 "language": language
             }
+        
+        return handler(content, caption, language)
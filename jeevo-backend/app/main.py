@@ -7,6 +7,8 @@ from app.config.settings import settings
 from app.routes import webhook
 from app.database.base import init_db, close_db
 from app.services.cache_service import cache_service
+from app.services.whatsapp_service import whatsapp_service
+from app.services.conversation_batcher import conversation_batcher
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +37,9 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Database initialization failed: {e}")
         raise
     
+    # Start batched conversation logging
+    await conversation_batcher.start()
+    
     # Connect to Redis
     try:
         logger.info("🔴 Connecting to Redis...")
@@ -54,10 +59,22 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("👋 Shutting down services...")
     
+    # Stop AI worker threads (replies still in progress are dropped)
+    webhook.shutdown_router_executor()
+    logger.info("✅ AI workers stopped")
+    
+    # Close WhatsApp API connections
+    await whatsapp_service.close()
+    logger.info("✅ WhatsApp client closed")
+    
     # Close Redis
     await cache_service.disconnect()
     logger.info("✅ Redis disconnected")
     
+    # Flush pending conversation logs
+    await conversation_batcher.stop()
+    logger.info("✅ Conversation logs flushed")
+    
     # Close database
     await close_db()
     logger.info("✅ Database closed")
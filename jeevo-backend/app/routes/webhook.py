@@ -1,16 +1,21 @@
 from fastapi import APIRouter, Request, HTTPException, Query, Depends
 from fastapi.responses import PlainTextResponse
-from typing import Dict, Any
+from typing import Dict, Any, Set, Coroutine, Optional
+import asyncio
 import logging
 import os
 import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.settings import settings
 from app.services.whatsapp_service import whatsapp_service
 from app.services.cache_service import cache_service
+from app.services.conversation_batcher import conversation_batcher
 from app.database.base import get_db
-from app.database.repositories import UserRepository, ConversationRepository
+from app.database.repositories import UserRepository
 from app.logic.multimodal_router import MultimodalRouter
 from app.logic.language_manager import LanguageManager
 from app.utils.helpers import (
@@ -25,6 +30,55 @@ router = APIRouter()
 multimodal_router = MultimodalRouter()
 language_manager = LanguageManager()
 
+# Greetings that trigger the welcome message
+GREETINGS = frozenset({"hi", "hello", "start", "namaste", "hey", "नमस्ते", "வணக்கம்", "నమస్కారం"})
+MAX_GREETING_LENGTH = max(len(greeting) for greeting in GREETINGS)
+
+# Worker threads for the blocking AI calls (LLM, STT, TTS, vision), so a slow
+# model response doesn't stall the event loop for every other webhook
+_router_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_router_executor() -> ThreadPoolExecutor:
+    """Get the AI worker pool, creating it on first use"""
+    global _router_executor
+    if _router_executor is None:
+        _router_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="router")
+    return _router_executor
+
+
+def shutdown_router_executor() -> None:
+    """Stop the AI worker threads, dropping replies still in progress"""
+    global _router_executor
+    if _router_executor is not None:
+        _router_executor.shutdown(wait=False, cancel_futures=True)
+        _router_executor = None
+
+# References to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Release a finished background task and log its failure, if any"""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("[BACKGROUND] Task failed: %s", task.exception())
+
+
+def run_in_background(coro: Coroutine) -> None:
+    """Schedule a coroutine without awaiting it"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+async def remove_temp_file(path: str) -> None:
+    """Delete a temporary file off the event loop"""
+    try:
+        await asyncio.to_thread(os.unlink, path)
+    except OSError as e:
+        logger.warning("[CLEANUP] Could not remove %s: %s", path, e)
+
 
 @router.get("/webhook", response_class=PlainTextResponse)
 async def verify_webhook(
@@ -36,7 +90,7 @@ async def verify_webhook(
     """
     Webhook verification endpoint for WhatsApp Cloud API
     """
-    logger.info(f"[WEBHOOK VERIFICATION] Mode: {mode}, Token received: {token[:10]}...")
+    logger.info("[WEBHOOK VERIFICATION] Mode: %s, Token received: %s...", mode, token[:10])
     
     if mode == "subscribe" and token == settings.WEBHOOK_VERIFY_TOKEN:
         logger.info("[WEBHOOK VERIFICATION] ✅ Success - Returning challenge")
@@ -52,9 +106,9 @@ async def receive_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     Main webhook endpoint to receive incoming WhatsApp messages
     """
     try:
-        webhook_data: Dict[str, Any] = await request.json()
+        webhook_data: Dict[str, Any] = orjson.loads(await request.body())
         
-        logger.info(f"[WEBHOOK] Received data")
+        logger.info("[WEBHOOK] Received data")
         
         if not is_webhook_valid(webhook_data):
             logger.warning("[WEBHOOK] Invalid webhook structure")
@@ -72,13 +126,11 @@ async def receive_webhook(request: Request, db: AsyncSession = Depends(get_db)):
             message = whatsapp_service.parse_incoming_message(webhook_data)
             log_incoming_message(message)
         except ValueError as e:
-            logger.error(f"[WEBHOOK] Error parsing message: {e}")
+            logger.error("[WEBHOOK] Error parsing message: %s", e)
             return {"status": "error", "message": str(e)}
         
-        try:
-            await whatsapp_service.mark_message_as_read(message.message_id)
-        except Exception as e:
-            logger.warning(f"[WEBHOOK] Could not mark message as read: {e}")
+        # Read receipts aren't part of the reply, so don't wait for them
+        run_in_background(whatsapp_service.mark_message_as_read(message.message_id))
         
         # Process the message with database
         await process_message(message, db)
@@ -86,7 +138,7 @@ async def receive_webhook(request: Request, db: AsyncSession = Depends(get_db)):
         return {"status": "ok", "message_id": message.message_id}
     
     except Exception as e:
-        logger.error(f"[WEBHOOK] Unexpected error: {e}", exc_info=True)
+        logger.error("[WEBHOOK] Unexpected error: %s", e, exc_info=True)
         return {"status": "error", "message": str(e)}
 
 
@@ -94,7 +146,7 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
     """
     Process incoming message with AI/multimodal capabilities
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Get or create user
@@ -103,7 +155,7 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
             phone_number=message.from_number
         )
         
-        logger.info(f"[USER] {'New user created' if is_new else 'Existing user'}: {user.phone_number}")
+        logger.info("[USER] %s: %s", "New user created" if is_new else "Existing user", user.phone_number)
         
         # Get user's preferred language
         user_language = user.language.value if user.language else "hi"
@@ -112,9 +164,14 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
         if message.message_type == "text" and message.text_content:
             detected_lang = language_manager.detect_language(message.text_content)
             
-            # Check for greeting messages
-            text_lower = message.text_content.lower().strip()
-            if text_lower in ["hi", "hello", "start", "namaste", "hey", "नमस्ते", "வணக்கம்", "నమస్కారం"] or is_new:
+            # Check for greeting messages (anything longer than the longest
+            # greeting is a real query, so skip normalizing it)
+            text_stripped = message.text_content.strip()
+            is_greeting = (
+                len(text_stripped) <= MAX_GREETING_LENGTH
+                and text_stripped.lower() in GREETINGS
+            )
+            if is_greeting or is_new:
                 # Send welcome message in detected language
                 welcome_msg = language_manager.get_system_message("welcome", detected_lang)
                 
@@ -123,19 +180,18 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
                     text=welcome_msg
                 )
                 
-                # Save to database
-                await ConversationRepository.create_conversation(
-                    db,
+                # Queue for batched save to database
+                await conversation_batcher.enqueue(
                     user_id=user.id,
                     message_id=message.message_id,
                     message_type=message.message_type,
                     user_message=message.text_content,
                     bot_response=welcome_msg,
                     media_id=message.media_id,
-                    response_time_ms=int((time.time() - start_time) * 1000)
+                    response_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
                 )
                 
-                logger.info(f"[RESPONSE] Sent welcome message to {message.from_number}")
+                logger.info("[RESPONSE] Sent welcome message to %s", message.from_number)
                 return
             
             # Update user language if different
@@ -159,9 +215,9 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
                 if message.message_type == "image" and message.text_content:
                     caption = message.text_content
                 
-                logger.info(f"[MEDIA] Downloaded {message.message_type} to {media_path}")
+                logger.info("[MEDIA] Downloaded %s to %s", message.message_type, media_path)
             except Exception as e:
-                logger.error(f"[MEDIA] Failed to download media: {e}")
+                logger.error("[MEDIA] Failed to download media: %s", e)
                 error_msg = language_manager.get_system_message("error", user_language)
                 await whatsapp_service.send_text_message(
                     to_number=message.from_number,
@@ -170,13 +226,22 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
                 return
         
         # Route message through multimodal router
-        logger.info(f"[ROUTER] Processing {message.message_type} message in {user_language}")
-        response = multimodal_router.route_message(
-            message_type=message.message_type,
-            content=content,
-            caption=caption,
-            language=user_language
-        )
+        logger.info("[ROUTER] Processing %s message in %s", message.message_type, user_language)
+        try:
+            response = await asyncio.get_running_loop().run_in_executor(
+                _get_router_executor(),
+                partial(
+                    multimodal_router.route_message,
+                    message_type=message.message_type,
+                    content=content,
+                    caption=caption,
+                    language=user_language
+                )
+            )
+        finally:
+            # Downloaded media is no longer needed once routed
+            if message.media_id:
+                run_in_background(remove_temp_file(content))
         
         # Handle response based on type
         if response["type"] == "text":
@@ -197,20 +262,17 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
                         audio_path=response["audio_path"]
                     )
                     bot_response = f"[Voice Response] {response['content']}"
-                    
-                    # Clean up temporary audio file
-                    try:
-                        os.remove(response["audio_path"])
-                    except:
-                        pass
                 except Exception as e:
-                    logger.error(f"[VOICE] Failed to send voice: {e}")
+                    logger.error("[VOICE] Failed to send voice: %s", e)
                     # Fallback to text
                     await whatsapp_service.send_text_message(
                         to_number=message.from_number,
                         text=response["content"]
                     )
                     bot_response = response["content"]
+                finally:
+                    # Clean up temporary audio file without holding up the reply
+                    run_in_background(remove_temp_file(response["audio_path"]))
             else:
                 # Send as text
                 await whatsapp_service.send_text_message(
@@ -229,11 +291,10 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
             bot_response = error_msg
         
         # Calculate response time
-        response_time_ms = int((time.time() - start_time) * 1000)
+        response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
-        # Save conversation to database
-        await ConversationRepository.create_conversation(
-            db,
+        # Queue conversation for batched save to database
+        await conversation_batcher.enqueue(
             user_id=user.id,
             message_id=message.message_id,
             message_type=message.message_type,
@@ -250,12 +311,12 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
             "conversation_state": "active",
             "language": user_language
         }
-        await cache_service.set_user_context(message.from_number, new_context)
+        await cache_service.merge_user_context(message.from_number, new_context)
         
-        logger.info(f"[RESPONSE] Sent to {message.from_number} (took {response_time_ms}ms)")
+        logger.info("[RESPONSE] Sent to %s (took %sms)", message.from_number, response_time_ms)
     
     except Exception as e:
-        logger.error(f"[PROCESS] Error processing message: {e}", exc_info=True)
+        logger.error("[PROCESS] Error processing message: %s", e, exc_info=True)
         
         try:
             error_message = "⚠️ Sorry, I encountered an error. Please try again in a moment."
@@ -264,6 +325,6 @@ async def process_message(message: 'WhatsAppMessage', db: AsyncSession) -> None:
                 text=error_message
             )
         except Exception as send_error:
-            logger.error(f"[PROCESS] Could not send error message: {send_error}")
+            logger.error("[PROCESS] Could not send error message: %s", send_error)
 
 
@@ -1,5 +1,5 @@
 import redis.asyncio as redis
-import json
+import orjson
 from typing import Optional, Any
 from datetime import timedelta
 import logging
@@ -13,29 +13,39 @@ class CacheService:
     
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
+        self.pool: Optional[redis.BlockingConnectionPool] = None
     
     async def connect(self):
         """Connect to Redis"""
         try:
-            self.redis_client = await redis.Redis(
+            # Bounded pool so concurrent webhooks don't share one connection;
+            # callers wait for a free connection instead of failing when it's full
+            self.pool = redis.BlockingConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-                decode_responses=True
+                decode_responses=True,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=5,
+                health_check_interval=30,
+                socket_keepalive=True
             )
+            self.redis_client = redis.Redis(connection_pool=self.pool)
             # Test connection
             await self.redis_client.ping()
             logger.info("✅ Redis connected successfully")
         except Exception as e:
-            logger.error(f"❌ Redis connection failed: {e}")
+            logger.error("❌ Redis connection failed: %s", e)
             raise
     
     async def disconnect(self):
         """Disconnect from Redis"""
         if self.redis_client:
             await self.redis_client.close()
-            logger.info("Redis disconnected")
+        if self.pool:
+            await self.pool.disconnect()
+        logger.info("Redis disconnected")
     
     async def set(
         self,
@@ -56,16 +66,12 @@ class CacheService:
                 expire = settings.REDIS_TTL
             
             # Serialize value to JSON
-            serialized_value = json.dumps(value)
+            serialized_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             
-            await self.redis_client.setex(
-                key,
-                expire,
-                serialized_value
-            )
+            await self.redis_client.set(key, serialized_value, ex=expire)
             return True
         except Exception as e:
-            logger.error(f"Error setting cache key {key}: {e}")
+            logger.error("Error setting cache key %s: %s", key, e)
             return False
     
     async def get(self, key: str) -> Optional[Any]:
@@ -81,10 +87,10 @@ class CacheService:
         try:
             value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
-            logger.error(f"Error getting cache key {key}: {e}")
+            logger.error("Error getting cache key %s: %s", key, e)
             return None
     
     async def delete(self, key: str) -> bool:
@@ -93,7 +99,7 @@ class CacheService:
             await self.redis_client.delete(key)
             return True
         except Exception as e:
-            logger.error(f"Error deleting cache key {key}: {e}")
+            logger.error("Error deleting cache key %s: %s", key, e)
             return False
     
     async def exists(self, key: str) -> bool:
@@ -101,7 +107,7 @@ class CacheService:
         try:
             return await self.redis_client.exists(key) > 0
         except Exception as e:
-            logger.error(f"Error checking cache key {key}: {e}")
+            logger.error("Error checking cache key %s: %s", key, e)
             return False
     
     async def set_session(
@@ -132,19 +138,74 @@ class CacheService:
         key = f"session:{phone_number}"
         return await self.delete(key)
     
+    @staticmethod
+    def _encode_fields(fields: dict) -> dict:
+        """JSON serialize each field value for storage in a Redis hash"""
+        return {
+            field: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            for field, value in fields.items()
+        }
+    
     async def set_user_context(
         self,
         phone_number: str,
         context: dict
     ) -> bool:
-        """Set conversation context for a user"""
+        """Set conversation context for a user, replacing any stored fields"""
+        key = f"context:{phone_number}"
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                if context:
+                    pipe.hset(key, mapping=self._encode_fields(context))
+                    pipe.expire(key, 1800)  # 30 minutes
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Error setting cache key %s: %s", key, e)
+            return False
+    
+    async def merge_user_context(
+        self,
+        phone_number: str,
+        patch: dict,
+        expire: int = 1800
+    ) -> bool:
+        """
+        Update fields of a user's conversation context in one round-trip
+        
+        The context is a Redis hash with one JSON value per field, so the
+        patch's fields are written as-is and the rest are left untouched.
+        
+        Args:
+            phone_number: User's phone number
+            patch: Fields to add or overwrite in the stored context
+            expire: Context expiration in seconds (default 30 minutes)
+        """
+        if not patch:
+            return True
         key = f"context:{phone_number}"
-        return await self.set(key, context, expire=1800)  # 30 minutes
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=self._encode_fields(patch))
+                pipe.expire(key, expire)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error("Error merging cache key %s: %s", key, e)
+            return False
     
     async def get_user_context(self, phone_number: str) -> Optional[dict]:
         """Get conversation context for a user"""
         key = f"context:{phone_number}"
-        return await self.get(key)
+        try:
+            fields = await self.redis_client.hgetall(key)
+            if not fields:
+                return None
+            return {field: orjson.loads(value) for field, value in fields.items()}
+        except Exception as e:
+            logger.error("Error getting cache key %s: %s", key, e)
+            return None
     
     async def cache_risk_level(
         self,
@@ -165,7 +226,7 @@ class CacheService:
         try:
             return await self.redis_client.incr(key)
         except Exception as e:
-            logger.error(f"Error incrementing counter {key}: {e}")
+            logger.error("Error incrementing counter %s: %s", key, e)
             return 0
     
     async def get_stats(self) -> dict:
@@ -179,7 +240,7 @@ class CacheService:
                 "uptime_seconds": info.get("uptime_in_seconds", 0)
             }
         except Exception as e:
-            logger.error(f"Error getting Redis stats: {e}")
+            logger.error("Error getting Redis stats: %s", e)
             return {"connected": False, "error": str(e)}
 
 
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from typing import Optional, List, Dict, Any
+from sqlalchemy.dialects.postgresql import insert
+
+from app.database.base import AsyncSessionLocal
+from app.database.models import Conversation
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationBatcher:
+    """Buffer conversation records and write them to the database in batches"""
+
+    def __init__(self, max_batch_size: int = 500, flush_interval: float = 0.2):
+        """
+        Args:
+            max_batch_size: Maximum rows written in a single INSERT
+            flush_interval: Seconds to wait for more rows before flushing
+        """
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background writer"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+            logger.info("Conversation batcher started")
+
+    async def stop(self):
+        """Flush pending records and stop the background writer"""
+        if self._worker is not None:
+            await self.queue.put(None)
+            await self._worker
+            self._worker = None
+            logger.info("Conversation batcher stopped")
+
+    async def enqueue(self, user_id: int, message_id: str, **kwargs) -> None:
+        """Queue a conversation record for the next batch"""
+        await self.queue.put({"user_id": user_id, "message_id": message_id, **kwargs})
+
+    async def _run(self):
+        """Collect rows until the batch is full or the flush interval expires"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            row = await self.queue.get()
+            if row is None:
+                break
+
+            rows: List[Dict[str, Any]] = [row]
+            deadline = loop.time() + self.flush_interval
+
+            while len(rows) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            await self._flush(rows)
+
+    async def _flush(self, rows: List[Dict[str, Any]]):
+        """Write a batch of conversation records, falling back to one row at a time"""
+        try:
+            await self._insert(rows)
+            logger.debug("Saved %s conversations", len(rows))
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error("Error saving conversation %s: %s", rows[0].get("message_id"), e)
+                return
+            logger.warning("Error saving %s conversations, retrying individually: %s", len(rows), e)
+
+        # Isolate the failing rows so one bad record doesn't drop the whole batch
+        for row in rows:
+            try:
+                await self._insert([row])
+            except Exception as e:
+                logger.error("Error saving conversation %s: %s", row.get("message_id"), e)
+
+    async def _insert(self, rows: List[Dict[str, Any]]):
+        """Insert conversation records in one statement"""
+        async with AsyncSessionLocal() as session:
+            # WhatsApp may redeliver a message, so skip rows already logged
+            await session.execute(
+                insert(Conversation).on_conflict_do_nothing(
+                    index_elements=[Conversation.message_id]
+                ),
+                rows
+            )
+            await session.commit()
+
+# Create global conversation batcher instance
+conversation_batcher = ConversationBatcher()
@@ -1,12 +1,31 @@
 import httpx
+import orjson
 import logging
 import os
-from typing import Dict, Any
+import tempfile
+from types import MappingProxyType
+from typing import Dict, Any, Optional
 from app.config.settings import settings
 from app.models.message import WhatsAppMessage, WhatsAppResponse
 
 logger = logging.getLogger(__name__)
 
+# Message types whose payload carries a downloadable media object
+MEDIA_MESSAGE_TYPES = frozenset({"audio", "image", "video", "document"})
+
+# Fail fast when the Graph API is unreachable or the pool is exhausted,
+# but allow slow responses and large media downloads to finish
+API_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=5.0)
+MEDIA_TIMEOUT = httpx.Timeout(60.0, connect=5.0, pool=5.0)
+
+# File extension used when saving downloaded media of each type
+MEDIA_EXTENSIONS = MappingProxyType({
+    "audio": "ogg",
+    "image": "jpg",
+    "video": "mp4",
+    "document": "pdf"
+})
+
 
 class WhatsAppService:
     """Service to handle WhatsApp API interactions"""
@@ -19,6 +38,29 @@ class WhatsAppService:
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         }
+        self._client: Optional[httpx.AsyncClient] = None
+        os.makedirs(settings.TEMP_DIR, exist_ok=True)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            # One pooled client keeps connections to the Graph API alive between calls
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=300
+                ),
+                timeout=API_TIMEOUT
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def parse_incoming_message(self, webhook_data: Dict[str, Any]) -> WhatsAppMessage:
         """Parse incoming webhook data into WhatsAppMessage model"""
@@ -44,23 +86,13 @@ class WhatsAppService:
             if message_type == "text":
                 text_content = message_data["text"]["body"]
             
-            elif message_type == "audio":
-                media_id = message_data["audio"]["id"]
-                mime_type = message_data["audio"]["mime_type"]
-            
-            elif message_type == "image":
-                media_id = message_data["image"]["id"]
-                mime_type = message_data["image"]["mime_type"]
+            elif message_type in MEDIA_MESSAGE_TYPES:
+                media = message_data[message_type]
+                media_id = media["id"]
+                mime_type = media["mime_type"]
                 # Caption if available
-                text_content = message_data["image"].get("caption")
-            
-            elif message_type == "video":
-                media_id = message_data["video"]["id"]
-                mime_type = message_data["video"]["mime_type"]
-            
-            elif message_type == "document":
-                media_id = message_data["document"]["id"]
-                mime_type = message_data["document"]["mime_type"]
+                if message_type == "image":
+                    text_content = media.get("caption")
             
             return WhatsAppMessage(
                 message_id=message_id,
@@ -74,7 +106,7 @@ class WhatsAppService:
             )
         
         except (KeyError, IndexError) as e:
-            logger.error(f"Error parsing webhook data: {e}")
+            logger.error("Error parsing webhook data: %s", e)
             raise ValueError(f"Invalid webhook data structure: {e}")
     
     async def send_text_message(self, to_number: str, text: str) -> Dict[str, Any]:
@@ -92,21 +124,21 @@ class WhatsAppService:
             }
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                logger.info(f"Message sent to {to_number}")
-                return response.json()
-            
-            except httpx.HTTPError as e:
-                logger.error(f"Error sending message: {e}")
-                raise
+        client = self._get_client()
+        try:
+            response = await client.post(
+                url,
+                headers=self.headers,
+                json=payload,
+                timeout=API_TIMEOUT
+            )
+            response.raise_for_status()
+            logger.info("Message sent to %s", to_number)
+            return orjson.loads(response.content)
+        
+        except httpx.HTTPError as e:
+            logger.error("Error sending message: %s", e)
+            raise
     
     async def send_audio_message(self, to_number: str, audio_path: str = None, audio_url: str = None) -> Dict[str, Any]:
         """Send an audio message via WhatsApp"""
@@ -129,21 +161,21 @@ class WhatsAppService:
             }
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                logger.info(f"Audio message sent to {to_number}")
-                return response.json()
-            
-            except httpx.HTTPError as e:
-                logger.error(f"Error sending audio: {e}")
-                raise
+        client = self._get_client()
+        try:
+            response = await client.post(
+                url,
+                headers=self.headers,
+                json=payload,
+                timeout=API_TIMEOUT
+            )
+            response.raise_for_status()
+            logger.info("Audio message sent to %s", to_number)
+            return orjson.loads(response.content)
+        
+        except httpx.HTTPError as e:
+            logger.error("Error sending audio: %s", e)
+            raise
     
     async def download_media(self, media_id: str, media_type: str) -> str:
         """
@@ -160,50 +192,45 @@ class WhatsAppService:
             # Step 1: Get media URL
             media_url_endpoint = f"{self.api_url}/{media_id}"
             
-            async with httpx.AsyncClient() as client:
-                # Get media info
-                response = await client.get(
-                    media_url_endpoint,
-                    headers=self.headers,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                media_info = response.json()
-                media_url = media_info.get("url")
-                
-                if not media_url:
-                    raise ValueError("Media URL not found in response")
-                
-                # Step 2: Download media file
-                media_response = await client.get(
-                    media_url,
-                    headers=self.headers,
-                    timeout=60.0
-                )
-                media_response.raise_for_status()
-                
-                # Step 3: Save to local file
-                extension_map = {
-                    "audio": "ogg",
-                    "image": "jpg",
-                    "video": "mp4",
-                    "document": "pdf"
-                }
-                extension = extension_map.get(media_type, "bin")
-                
-                # Create temp directory if not exists
-                os.makedirs("temp", exist_ok=True)
-                
-                filepath = f"temp/media_{media_id}.{extension}"
-                
-                with open(filepath, "wb") as f:
-                    f.write(media_response.content)
-                
-                logger.info(f"Downloaded {media_type} to {filepath}")
-                return filepath
-                
+            client = self._get_client()
+            # Get media info
+            response = await client.get(
+                media_url_endpoint,
+                headers=self.headers,
+                timeout=API_TIMEOUT
+            )
+            response.raise_for_status()
+            media_info = orjson.loads(response.content)
+            media_url = media_info.get("url")
+            
+            if not media_url:
+                raise ValueError("Media URL not found in response")
+            
+            # Step 2: Download media file
+            media_response = await client.get(
+                media_url,
+                headers=self.headers,
+                timeout=MEDIA_TIMEOUT
+            )
+            media_response.raise_for_status()
+            
+            # Step 3: Save to local file
+            extension = MEDIA_EXTENSIONS.get(media_type, "bin")
+            
+            with tempfile.NamedTemporaryFile(
+                dir=settings.TEMP_DIR,
+                prefix="media_",
+                suffix=f".{extension}",
+                delete=False
+            ) as f:
+                f.write(media_response.content)
+                filepath = f.name
+            
+            logger.info("Downloaded %s to %s", media_type, filepath)
+            return filepath
+            
         except Exception as e:
-            logger.error(f"Error downloading media {media_id}: {e}")
+            logger.error("Error downloading media %s: %s", media_id, e)
             raise
     
     async def mark_message_as_read(self, message_id: str) -> Dict[str, Any]:
@@ -216,20 +243,20 @@ class WhatsAppService:
             "message_id": message_id
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
-            
-            except httpx.HTTPError as e:
-                logger.error(f"Error marking message as read: {e}")
-                raise
+        client = self._get_client()
+        try:
+            response = await client.post(
+                url,
+                headers=self.headers,
+                json=payload,
+                timeout=API_TIMEOUT
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        
+        except httpx.HTTPError as e:
+            logger.error("Error marking message as read: %s", e)
+            raise
 
 
 # Create global service instance
@@ -68,6 +68,6 @@ def is_webhook_valid(webhook_data: Dict[str, Any]) -> bool:
 
 def log_incoming_message(message: 'WhatsAppMessage') -> None:
     """Log incoming message details"""
-    logger.info(f"[INCOMING] Type: {message.message_type} | From: {message.from_number} | ID: {message.message_id}")
+    logger.info("[INCOMING] Type: %s | From: %s | ID: %s", message.message_type, message.from_number, message.message_id)
     if message.text_content:
-        logger.info(f"[CONTENT] {message.text_content}")
\ No newline at end of file
+        logger.info("[CONTENT] %s", message.text_content)
\ No newline at end of file
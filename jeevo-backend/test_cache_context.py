@@ -0,0 +1,69 @@
+"""
+Cache context test for Jeevo Bot - needs a running Redis (REDIS_HOST/REDIS_PORT)
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.services.cache_service import CacheService
+
+
+async def _connect():
+    cache = CacheService()
+    try:
+        await cache.connect()
+    except Exception as e:
+        pytest.skip(f"Redis not reachable: {e}")
+    return cache
+
+
+def test_user_context_round_trips_lists_and_large_integers():
+    """Merged context keeps list fields and integers wider than a double"""
+    async def run():
+        cache = await _connect()
+        phone = f"test-{uuid.uuid4().hex}"
+        big = 2**63 - 1
+        try:
+            assert await cache.set_user_context(phone, {
+                "symptoms": ["fever", "cough"],
+                "pending": [],
+                "last_message_time": big
+            })
+            assert await cache.merge_user_context(phone, {
+                "conversation_state": "active",
+                "pending": [],
+                "media_ids": [123456789012345678]
+            })
+            
+            context = await cache.get_user_context(phone)
+            assert context == {
+                "symptoms": ["fever", "cough"],
+                "pending": [],
+                "last_message_time": big,
+                "conversation_state": "active",
+                "media_ids": [123456789012345678]
+            }
+            assert 0 < await cache.redis_client.ttl(f"context:{phone}") <= 1800
+        finally:
+            await cache.redis_client.delete(f"context:{phone}")
+            await cache.disconnect()
+    
+    asyncio.run(run())
+
+
+def test_set_user_context_replaces_stored_fields():
+    """Setting the context drops fields from the previous context"""
+    async def run():
+        cache = await _connect()
+        phone = f"test-{uuid.uuid4().hex}"
+        try:
+            await cache.set_user_context(phone, {"language": "hi", "step": 2})
+            await cache.set_user_context(phone, {"language": "en"})
+            assert await cache.get_user_context(phone) == {"language": "en"}
+        finally:
+            await cache.redis_client.delete(f"context:{phone}")
+            await cache.disconnect()
+    
+    asyncio.run(run())